@@ -1,59 +1,75 @@
 """Configuration module for managing environment variables and settings."""
 import os
+import re
+import functools
 from dataclasses import dataclass
-from typing import List
+from types import MappingProxyType
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
+# Load .env once at import and keep a read-only snapshot of the environment
+load_dotenv()
+_ENV = MappingProxyType(dict(os.environ))
 
-@dataclass
+# Comma separator with any surrounding whitespace
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     """Application configuration class."""
     
-    subreddits: List[str]
+    subreddits: Tuple[str, ...]
     together_api_key: str
     smtp_server: str
     smtp_port: int
     sender_email: str
     sender_password: str
-    recipient_emails: List[str]
+    recipient_emails: Tuple[str, ...]
     brightdata_api_key: str
     time_filter: str = "day"
     posts_per_subreddit: int = 10
+    cache_name: Optional[str] = None
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> "Config":
         """
         Load configuration from environment variables.
         
+        Values come from the environment snapshot taken at import time. The
+        result is cached, so repeated calls return the same instance.
+        
         Returns:
             Config: Configuration instance with loaded values.
             
         Raises:
             ValueError: If required environment variables are missing.
         """
-        load_dotenv()
+        env = _ENV
         
         # Subreddits to monitor (comma-separated)
-        subreddits_str = os.getenv("SUBREDDITS", "python,technology,programming")
-        subreddits = [s.strip() for s in subreddits_str.split(",")]
+        subreddits_str = env.get("SUBREDDITS", "python,technology,programming")
+        subreddits = tuple(_CSV_RE.split(subreddits_str.strip()))
         
         # LLM API key
-        together_api_key = os.getenv("TOGETHER_API_KEY")
+        together_api_key = env.get("TOGETHER_API_KEY")
         
         # Email configuration
-        smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-        smtp_port = int(os.getenv("SMTP_PORT", "465"))
-        sender_email = os.getenv("SENDER_EMAIL")
-        sender_password = os.getenv("SENDER_PASSWORD")
-        recipient_emails_str = os.getenv("RECIPIENT_EMAILS")
-        recipient_emails = [email.strip() for email in recipient_emails_str.split(",")] if recipient_emails_str else []
+        smtp_server = env.get("SMTP_SERVER", "smtp.gmail.com")
+        smtp_port = int(env.get("SMTP_PORT", "465"))
+        sender_email = env.get("SENDER_EMAIL")
+        sender_password = env.get("SENDER_PASSWORD")
+        recipient_emails_str = env.get("RECIPIENT_EMAILS")
+        recipient_emails = tuple(_CSV_RE.split(recipient_emails_str.strip())) if recipient_emails_str else ()
         
         # Bright Data API key (required)
-        brightdata_api_key = os.getenv("BRIGHTDATA_API_KEY")
+        brightdata_api_key = env.get("BRIGHTDATA_API_KEY")
         
         # Optional settings
-        time_filter = os.getenv("TIME_FILTER", "day")
-        posts_per_subreddit = int(os.getenv("POSTS_PER_SUBREDDIT", "10"))
+        time_filter = env.get("TIME_FILTER", "day")
+        posts_per_subreddit = int(env.get("POSTS_PER_SUBREDDIT", "10"))
+        cache_name = env.get("CACHE_NAME") or None
         
         # Validate required environment variables
         if not together_api_key:
@@ -77,6 +93,7 @@ class Config:
             recipient_emails=recipient_emails,
             brightdata_api_key=brightdata_api_key,
             time_filter=time_filter,
-            posts_per_subreddit=posts_per_subreddit
+            posts_per_subreddit=posts_per_subreddit,
+            cache_name=cache_name
         )
 
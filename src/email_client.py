@@ -1,7 +1,11 @@
 """Email client for sending analysis emails."""
+import logging
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from typing import Sequence
+
+LOGGER = logging.getLogger(__name__)
 
 
 class EmailClient:
@@ -15,8 +19,24 @@ class EmailClient:
         self._sender_email = sender_email
         self._sender_password = sender_password
     
-    def send_analysis(self, recipients: list[str], content: str, date_str: str) -> bool:
-        """Send build opportunity analysis email as HTML."""
+    def connect(self) -> smtplib.SMTP_SSL:
+        """Open an authenticated SMTP SSL connection."""
+        server = smtplib.SMTP_SSL(self._smtp_server, self._smtp_port)
+        try:
+            server.login(self._sender_email, self._sender_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def send_analysis(self, recipients: Sequence[str], content: str, date_str: str,
+                      server: smtplib.SMTP_SSL | None = None) -> bool:
+        """Send build opportunity analysis email as HTML.
+        
+        An already open connection from ``connect()`` can be passed as
+        ``server``; otherwise, or if it has since been dropped, a new one is
+        opened.
+        """
         try:
             html_body = f"""
             <!DOCTYPE html>
@@ -115,13 +135,20 @@ class EmailClient:
             html_part = MIMEText(html_body, 'html', 'utf-8')
             msg.attach(html_part)
 
-            with smtplib.SMTP_SSL(self._smtp_server, self._smtp_port) as server:
-                server.login(self._sender_email, self._sender_password)
-                server.sendmail(self._sender_email, recipients, msg.as_string())
+            message = msg.as_string()
+            try:
+                with server or self.connect() as smtp:
+                    smtp.sendmail(self._sender_email, recipients, message)
+            except smtplib.SMTPServerDisconnected:
+                if server is None:
+                    raise
+                # The pre-opened connection was dropped while idle; retry once
+                with self.connect() as smtp:
+                    smtp.sendmail(self._sender_email, recipients, message)
             
-            print(f"✅ Email sent to {', '.join(recipients)}\n")
+            LOGGER.info("✅ Email sent to %s\n", ", ".join(recipients))
             return True
             
         except Exception as e:
-            print(f"❌ Email failed: {e}\n")
+            LOGGER.error("❌ Email failed: %s\n", e)
             return False
@@ -1,39 +1,9 @@
 """LLM client for interacting with Together AI API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from together import Together
 
 
-class LLMClient:
-    """Client for interacting with Together AI's LLM API."""
-    
-    def __init__(self, api_key: str, model: str = "meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo"):
-        """Initialize LLM client."""
-        self._client = Together(api_key=api_key)
-        self._model = model
-    
-    def analyze_build_opportunity(self, posts: List[Dict[str, Any]], max_posts: int = 10) -> str:
-        """Analyze Reddit posts for monetizable build opportunities."""
-        posts_content = []
-        
-        for i, post in enumerate(posts[:max_posts], 1):
-            comments = ""
-            if post.get('top_comments'):
-                comments = "\nTop Comments:\n" + "\n".join(
-                    f"  - {c[:200]}" for c in post['top_comments'][:5]
-                )
-            
-            posts_content.append(
-                f"Post #{i}:\n"
-                f"Title: {post['title']}\n"
-                f"Subreddit: r/{post['subreddit']}\n"
-                f"Score: {post['score']} | Comments: {post['num_comments']}\n"
-                f"Content: {post.get('selftext', '')[:500] or '(Link post)'}{comments}\n"
-                f"URL: {post['permalink']}"
-            )
-        
-        combined_posts = "\n\n".join(posts_content)
-        
-        prompt = f"""You are a product and monetization strategist helping a solo software developer.
+PROMPT_TEMPLATE = """You are a product and monetization strategist helping a solo software developer.
                 I will paste multiple Reddit posts. Extract ALL viable build ideas that could generate recurring monthly revenue.
 
                 Context:
@@ -76,11 +46,57 @@ class LLMClient:
                 - If NO viable opportunities exist, output: <div class="no-ideas"><p>No viable build opportunities found.</p></div>
 
                 Reddit Posts:
-                {combined_posts}
+                %s
                 """
-                
-        return self._client.chat.completions.create(
+
+
+def _format_post(i: int, post: Dict[str, Any]) -> str:
+    """Format a single Reddit post for the analysis prompt."""
+    top_comments = post.get('top_comments')
+    comments = ""
+    if top_comments:
+        comments = "\nTop Comments:\n" + "\n".join(
+            f"  - {c[:200]}" for c in top_comments[:5]
+        )
+    
+    selftext = post.get('selftext', '')[:500] or '(Link post)'
+    return (
+        f"Post #{i}:\n"
+        f"Title: {post['title']}\n"
+        f"Subreddit: r/{post['subreddit']}\n"
+        f"Score: {post['score']} | Comments: {post['num_comments']}\n"
+        f"Content: {selftext}{comments}\n"
+        f"URL: {post['permalink']}"
+    )
+
+
+class LLMClient:
+    """Client for interacting with Together AI's LLM API."""
+    
+    def __init__(self, api_key: str, model: str = "meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo"):
+        """Initialize LLM client."""
+        self._client = Together(api_key=api_key)
+        self._model = model
+    
+    def analyze_build_opportunity(self, posts: List[Dict[str, Any]], max_posts: int = 10) -> str:
+        """Analyze Reddit posts for monetizable build opportunities."""
+        return "".join(self.stream_build_opportunity(posts=posts, max_posts=max_posts))
+    
+    def stream_build_opportunity(
+        self, posts: List[Dict[str, Any]], max_posts: int = 10
+    ) -> Iterator[str]:
+        """Stream the build opportunity analysis as text chunks."""
+        combined_posts = "\n\n".join(
+            _format_post(i, post) for i, post in enumerate(posts[:max_posts], 1)
+        )
+        prompt = PROMPT_TEMPLATE % combined_posts
+        
+        stream = self._client.chat.completions.create(
             model=self._model,
-            messages=[{"role": "user", "content": prompt}]
-        ).choices[0].message.content
+            messages=[{"role": "user", "content": prompt}],
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
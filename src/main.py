@@ -1,11 +1,16 @@
 """Main application entry point for Reddit Build Opportunity Analyzer."""
+import sys
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from config import Config
 from llm_client import LLMClient
 from email_client import EmailClient
-from reddit_scraper import fetch_posts_from_subreddits
+from reddit_scraper import RedditScraper, configure_logging, fetch_posts_from_subreddits
 import random
 
+LOGGER = logging.getLogger(__name__)
+
 
 class BuildOpportunityAnalyzer:
     """Analyzes Reddit posts for monetizable build opportunities."""
@@ -19,18 +24,22 @@ class BuildOpportunityAnalyzer:
             sender_email=config.sender_email,
             sender_password=config.sender_password
         )
+        self.scraper = RedditScraper(
+            brightdata_api_key=config.brightdata_api_key,
+            cache_name=config.cache_name
+        )
     
     def run(self) -> None:
         """Execute the analysis."""
-        print("=" * 60)
-        print("🚀 Reddit Build Opportunity Analyzer")
-        print("=" * 60)
+        LOGGER.info("=" * 60)
+        LOGGER.info("🚀 Reddit Build Opportunity Analyzer")
+        LOGGER.info("=" * 60)
         
         # Fetch posts
-        print(f"\n🔍 Fetching from: {', '.join(f'r/{s}' for s in self.config.subreddits)}")
+        LOGGER.info("\n🔍 Fetching from: %s", ", ".join(f"r/{s}" for s in self.config.subreddits))
         posts = fetch_posts_from_subreddits(
             subreddits=self.config.subreddits,
-            brightdata_api_key=self.config.brightdata_api_key,
+            scraper=self.scraper,
             category="top",
             time_filter=self.config.time_filter,
             posts_per_subreddit=self.config.posts_per_subreddit
@@ -38,36 +47,76 @@ class BuildOpportunityAnalyzer:
         
         # Shuffle posts for variety
         random.shuffle(posts)
-        print(f"📊 Found {len(posts)} posts (shuffled for variety)")
+        LOGGER.info("📊 Found %d posts (shuffled for variety)", len(posts))
         
         if not posts:
-            print("⚠️  No posts found. Exiting.")
+            LOGGER.warning("⚠️  No posts found. Exiting.")
             return
         
         # Analyze opportunities
-        print("🤖 Analyzing build opportunities...")
-        analysis = self.llm_client.analyze_build_opportunity(posts=posts, max_posts=10)
-        print("✅ Analysis complete\n")
+        LOGGER.info("🤖 Analyzing build opportunities...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Open the SMTP connection while the LLM response streams in
+            smtp_future = executor.submit(self.email_client.connect)
+            try:
+                analysis = self.llm_client.analyze_build_opportunity(posts=posts, max_posts=10)
+            except BaseException:
+                _close_connection(smtp_future)
+                raise
+        LOGGER.info("✅ Analysis complete\n")
+        
+        try:
+            smtp_server = smtp_future.result()
+        except Exception as e:
+            LOGGER.warning("⚠️  SMTP pre-connect failed, retrying on send: %s", e)
+            smtp_server = None
         
         # Send email
-        print(f"📧 Sending to: {', '.join(self.config.recipient_emails)}")
+        LOGGER.info("📧 Sending to: %s", ", ".join(self.config.recipient_emails))
         success = self.email_client.send_analysis(
             recipients=self.config.recipient_emails,
             content=analysis,
-            date_str=datetime.now().strftime("%B %d, %Y")
+            date_str=datetime.now().strftime("%B %d, %Y"),
+            server=smtp_server
         )
         
-        print("=" * 60)
-        print("✅ Completed!" if success else "⚠️  Email failed")
-        print("=" * 60)
+        LOGGER.info("=" * 60)
+        LOGGER.info("✅ Completed!" if success else "⚠️  Email failed")
+        LOGGER.info("=" * 60)
+
+
+def _close_connection(smtp_future: Future) -> None:
+    """Close the pre-opened SMTP connection once it is no longer needed."""
+    try:
+        smtp_future.result().close()
+    except Exception:
+        pass
+
+
+def _configure_console_logging() -> None:
+    """Write app and email status, and scraper warnings, to stdout."""
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    for name in (__name__, "email_client"):
+        logger = logging.getLogger(name)
+        logger.addHandler(console)
+        logger.setLevel(logging.INFO)
+    
+    # Scraper failures would otherwise only reach the log file
+    scraper_console = logging.StreamHandler(sys.stdout)
+    scraper_console.setLevel(logging.WARNING)
+    scraper_console.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    logging.getLogger("reddit_scraper").addHandler(scraper_console)
 
 
 def main():
     """Application entry point."""
+    configure_logging()
+    _configure_console_logging()
     try:
         BuildOpportunityAnalyzer(Config.from_env()).run()
     except Exception as e:
-        print(f"❌ Error: {e}")
+        LOGGER.error("❌ Error: %s", e)
         raise
 
 
@@ -2,34 +2,311 @@
 
 import time
 import random
+import atexit
+import io
 import logging
+import logging.handlers
+import queue
+import re
+import sys
+import threading
 import urllib.parse
-from typing import Any
+from array import array
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Iterator, IO, Sequence
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import ijson
+except ImportError:  # listings are then parsed in one go
+    ijson = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # persistent response caching is then unavailable
+    CachedSession = None
+
+try:
+    from orjson import JSONDecodeError, dumps as _json_dumps, loads as _json_loads
+except ImportError:  # orjson is a speedup; fall back to the stdlib parser
+    import json
+    from json import JSONDecodeError, loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
 
-# Configure logging
-logging.basicConfig(
-    filename="reddit_scraper.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
 LOGGER = logging.getLogger(__name__)
+# Stay silent unless the application configures logging
+LOGGER.addHandler(logging.NullHandler())
+
+# Bright Data Web Unlocker endpoint every request is sent through
+_BRIGHTDATA_URL = "https://api.brightdata.com/request"
+
+# ijson prefix of each post object inside a listing response
+_LISTING_POST_PREFIX = "data.children.item.data"
+
+# HTTP statuses worth retrying; any other error status fails immediately
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 30.0
+
+# Consecutive retryable failures before requests are short-circuited, and the
+# longest cool-down the circuit stays open for
+_CIRCUIT_THRESHOLD = 5
+_CIRCUIT_MAX_COOLDOWN = 300.0
+
+# Default concurrency of fetch_posts_from_subreddits. The connection pool is
+# sized so every worker, plus each listing's next-page prefetch, keeps its
+# own warm connection.
+_LISTING_WORKERS = 8
+_COMMENT_WORKERS = 16
+_POOL_MAXSIZE = 2 * _LISTING_WORKERS + _COMMENT_WORKERS
+
+# Client-side pacing of outgoing requests: sustained requests per second and
+# the burst allowed after idling. Reddit budgets 60 req/min anonymous and
+# 600 req/min with OAuth; Bright Data rotates exit IPs, so pace at the latter.
+_RATE_LIMIT = 10.0
+_RATE_BURST = 10
+
+# Number of post details kept in memory per scraper
+_DETAIL_CACHE_SIZE = 4096
+
+# Post bodies are only used as short previews (the LLM prompt keeps 500
+# characters), so keep a little slack instead of the full text
+_MAX_SELFTEXT_CHARS = 800
+
+# Markers Reddit leaves in place of deleted or removed content
+_DELETED_RE = re.compile(r"\[(?:deleted|removed)\]", re.IGNORECASE)
+
+# Installed on demand by the opt-in logging helpers below
+_log_listener: logging.handlers.QueueListener | None = None
+_stdout_handler: logging.Handler | None = None
+
+
+def configure_logging(filename: str = "reddit_scraper.log", level: int = logging.INFO) -> None:
+    """Send log records to ``filename`` from a background thread.
+    
+    The root logger only enqueues records, so worker threads never block on
+    file writes. Calling this again has no effect.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    file_handler = logging.FileHandler(filename)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
+    # Flush what is still queued on exit
+    atexit.register(_log_listener.stop)
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+
+def _enable_stdout_logging() -> None:
+    """Echo scraper log records to stdout, once however many scrapers ask."""
+    global _stdout_handler
+    if _stdout_handler is not None:
+        return
+    _stdout_handler = logging.StreamHandler(sys.stdout)
+    _stdout_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    LOGGER.addHandler(_stdout_handler)
+    if not LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.setLevel(logging.INFO)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the upstream looks down."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilling at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Reserve the token up front (possibly going negative) so the
+            # lock isn't held while waiting and callers are served in turn
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+@dataclass
+class PostBatch:
+    """Posts from one subreddit listing page, stored column-wise.
+    
+    A batch lives while its comment lookups are in flight: every post has a
+    preallocated ``top_comments`` slot that exactly one comment worker
+    fills, so the workers never share a record or need a lock. Records are
+    only built by ``to_records`` once the comment pool has drained, because
+    the rest of the application consumes plain per-post dicts.
+    """
+    
+    subreddit: str
+    titles: list[str] = field(default_factory=list)
+    authors: list[str] = field(default_factory=list)
+    permalinks: list[str] = field(default_factory=list)
+    scores: array = field(default_factory=lambda: array("q"))
+    num_comments: array = field(default_factory=lambda: array("q"))
+    created_utc: array = field(default_factory=lambda: array("d"))
+    selftexts: list[str] = field(default_factory=list)
+    image_urls: list[str | None] = field(default_factory=list)
+    thumbnail_urls: list[str | None] = field(default_factory=list)
+    top_comments: list[list[str] | None] = field(default_factory=list)
+    
+    def __post_init__(self) -> None:
+        self.subreddit = sys.intern(self.subreddit)
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+    
+    def append(self, post_data: dict) -> None:
+        """Append one post from a listing entry's ``data`` object."""
+        get = post_data.get
+        self.titles.append(get("title", ""))
+        # The same authors recur across listings; interning shares one
+        # string per name and lets equality checks short-circuit on identity
+        author = get("author")
+        self.authors.append(sys.intern(author) if author else "")
+        self.permalinks.append(get("permalink", ""))
+        self.scores.append(get("score") or 0)
+        self.num_comments.append(get("num_comments") or 0)
+        self.created_utc.append(get("created_utc") or 0)
+        self.selftexts.append(get("selftext", "")[:_MAX_SELFTEXT_CHARS])
+        
+        image_url = get("url")
+        if image_url is None or get("post_hint") != "image":
+            # Most posts carry a well-formed preview; catching the odd
+            # missing or empty level beats probing each one
+            try:
+                image_url = post_data["preview"]["images"][0]["source"]["url"]
+            except (KeyError, IndexError, TypeError):
+                image_url = None
+        self.image_urls.append(image_url)
+        
+        thumbnail = get("thumbnail")
+        if thumbnail is not None and thumbnail not in ("self", "default"):
+            self.thumbnail_urls.append(thumbnail)
+        else:
+            self.thumbnail_urls.append(None)
+        
+        self.top_comments.append(None)
+    
+    def to_records(self) -> list[dict]:
+        """Return the posts as dicts; fields that were never set are omitted."""
+        records = []
+        for i in range(len(self)):
+            post_info = {
+                "title": self.titles[i],
+                "author": self.authors[i],
+                "subreddit": self.subreddit,
+                "permalink": self.permalinks[i],
+                "score": self.scores[i],
+                "num_comments": self.num_comments[i],
+                "created_utc": self.created_utc[i],
+                "selftext": self.selftexts[i],
+            }
+            if self.image_urls[i] is not None:
+                post_info["image_url"] = self.image_urls[i]
+            if self.thumbnail_urls[i] is not None:
+                post_info["thumbnail_url"] = self.thumbnail_urls[i]
+            if self.top_comments[i] is not None:
+                post_info["top_comments"] = self.top_comments[i]
+            records.append(post_info)
+        return records
 
 
 class RedditScraper:
     """Reddit scraper using Bright Data Web Unlocker API."""
 
-    def __init__(self, brightdata_api_key: str, timeout: int = 30) -> None:
+    def __init__(
+        self,
+        brightdata_api_key: str,
+        timeout: int = 30,
+        pool_maxsize: int = _POOL_MAXSIZE,
+        cache_name: str | None = None,
+        cache_expire_after: int = 3600,
+        rate_limit: float = _RATE_LIMIT,
+        verbose: bool = False,
+    ) -> None:
+        """Create a scraper.
+        
+        With ``cache_name``, Bright Data responses are also cached on disk in
+        a SQLite database (requires ``requests-cache``), so reruns within
+        ``cache_expire_after`` seconds don't pay for the same request twice.
+        ``rate_limit`` caps outgoing requests per second across all threads.
+        ``verbose`` also echoes this module's log records to stdout.
+        """
         if not brightdata_api_key:
             raise ValueError("BRIGHTDATA_API_KEY is required")
         
         self.brightdata_api_key = brightdata_api_key
         self.timeout = timeout
+        if verbose:
+            _enable_stdout_logging()
+        # One keep-alive session reuses TLS connections to the Bright Data API;
+        # only the request body changes between calls, so headers are set once
+        self._cached = bool(cache_name)
+        if self._cached:
+            if CachedSession is None:
+                raise ValueError("requests-cache is required to use cache_name")
+            # Every call is a POST whose body holds the Reddit URL, and the
+            # body is part of the cache key
+            self.session = CachedSession(
+                cache_name,
+                backend="sqlite",
+                expire_after=cache_expire_after,
+                allowable_methods=("POST",),
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {brightdata_api_key}",
+            "Content-Type": "application/json"
+        })
+        self.pool_maxsize = pool_maxsize
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize))
+        # LRU of fetched post details, plus the lookups currently in flight so
+        # concurrent requests for the same post share a single download
+        self._detail_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+        self._detail_in_flight: dict[tuple, Future] = {}
+        self._detail_lock = threading.Lock()
+        # Circuit breaker shared by all worker threads
+        self._circuit_lock = threading.Lock()
+        self._circuit_failures = 0
+        self._circuit_open_until = 0.0
+        # Paces requests ahead of the upstream quota instead of waiting for 429s
+        self._limiter = TokenBucket(rate=rate_limit, capacity=_RATE_BURST)
         LOGGER.info("Initialized with Bright Data Web Unlocker")
-        print("🌐 Using Bright Data Web Unlocker API")
     
-    def _make_request(self, url: str, params: dict = None, max_retries: int = 3) -> dict:
-        """Make a request using Bright Data Web Unlocker API."""
+    def _make_request(
+        self, url: str, params: dict = None, max_retries: int = 3, stream: bool = False
+    ) -> Any:
+        """Make a request using Bright Data Web Unlocker API.
+        
+        Returns the decoded JSON body, or with ``stream=True`` the unread
+        response so the caller can parse it incrementally.
+        """
         # Build full URL with params
         if params:
             clean_params = {k: v for k, v in params.items() if v is not None}
@@ -38,36 +315,124 @@ class RedditScraper:
         else:
             full_url = url
         
-        headers = {
-            "Authorization": f"Bearer {self.brightdata_api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
+        # Encode the body once; retries resend the same bytes
+        body = _json_dumps({
             "zone": "web_unlocker1",
             "url": full_url,
             "format": "raw"
-        }
+        })
         
+        delay = _BACKOFF_BASE
         for attempt in range(max_retries):
+            if self.circuit_open:
+                raise CircuitOpenError(f"Circuit open, skipping request to {full_url}")
+            
             try:
-                response = requests.post(
-                    "https://api.brightdata.com/request",
-                    json=data,
-                    headers=headers,
-                    timeout=self.timeout
-                )
+                response = self._send(body, stream)
                 response.raise_for_status()
-                return response.json()
+                self._record_success()
+                from_cache = getattr(response, "from_cache", False)
+                if not from_cache:
+                    self._respect_rate_limit(response.headers)
+                if stream:
+                    # Cached responses carry their body in memory instead
+                    if not from_cache:
+                        response.raw.decode_content = True
+                    return response
+                return _json_loads(response.content)
                     
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, JSONDecodeError) as e:
                 LOGGER.warning("Request attempt %d/%d failed: %s", attempt + 1, max_retries, e)
-                if attempt == max_retries - 1:
+                response = getattr(e, "response", None)
+                retryable = response is None or response.status_code in _RETRY_STATUSES
+                if retryable:
+                    self._record_failure()
+                    delay = self._retry_delay(delay, response)
+                # A streamed error response holds its pooled connection until closed
+                if response is not None:
+                    response.close()
+                if not retryable or attempt == max_retries - 1:
                     raise
-                time.sleep(2 ** attempt)
+                time.sleep(delay)
         
         raise Exception("Max retries exceeded")
 
+    def _send(self, body: bytes, stream: bool) -> requests.Response:
+        """POST ``body`` to Bright Data, answering from the cache when possible.
+        
+        Only requests that actually go upstream take a token from the limiter.
+        """
+        if self._cached:
+            response = self.session.post(
+                _BRIGHTDATA_URL,
+                data=body,
+                timeout=self.timeout,
+                stream=stream,
+                only_if_cached=True
+            )
+            # A miss comes back as a synthetic 504; only 200s are cached
+            if response.status_code != 504:
+                return response
+        
+        self._limiter.acquire()
+        return self.session.post(
+            _BRIGHTDATA_URL,
+            data=body,
+            timeout=self.timeout,
+            stream=stream
+        )
+
+    @property
+    def circuit_open(self) -> bool:
+        """Whether requests are currently being short-circuited."""
+        return time.monotonic() < self._circuit_open_until
+
+    def _record_success(self) -> None:
+        """Close the circuit after any successful response."""
+        if self._circuit_failures:
+            with self._circuit_lock:
+                self._circuit_failures = 0
+                self._circuit_open_until = 0.0
+
+    def _record_failure(self) -> None:
+        """Count a retryable failure, opening the circuit past the threshold."""
+        with self._circuit_lock:
+            self._circuit_failures += 1
+            if self._circuit_failures >= _CIRCUIT_THRESHOLD:
+                cooldown = min(_CIRCUIT_MAX_COOLDOWN, 2 ** self._circuit_failures)
+                self._circuit_open_until = time.monotonic() + cooldown
+                LOGGER.warning("Circuit opened after %d consecutive failures, pausing requests for %.0fs",
+                               self._circuit_failures, cooldown)
+
+    @staticmethod
+    def _retry_delay(previous: float, response: requests.Response | None) -> float:
+        """Seconds to wait before the next attempt.
+        
+        Honors a Retry-After header when the server sends one, up to the
+        backoff cap; otherwise uses decorrelated jitter so concurrent workers
+        don't retry in lockstep.
+        """
+        retry_after = _parse_retry_after(response)
+        if retry_after is not None:
+            # A far-off retry time would tie up a worker and its pooled
+            # connection; past the cap the circuit breaker takes over
+            return min(_BACKOFF_CAP, retry_after)
+        return min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, previous * 3))
+
+    @staticmethod
+    def _respect_rate_limit(headers: Any) -> None:
+        """Pause only when the response reports an almost exhausted rate limit."""
+        try:
+            remaining = float(headers.get("x-ratelimit-remaining", 60))
+            reset = float(headers.get("x-ratelimit-reset", 60))
+        except ValueError:
+            return
+        
+        if remaining < 5:
+            delay = reset / remaining if remaining > 0 else reset
+            LOGGER.info("Rate limit nearly exhausted (%.0f left), sleeping %.1fs", remaining, delay)
+            time.sleep(delay)
+
     def fetch_subreddit_posts(
         self,
         subreddit: str,
@@ -76,87 +441,178 @@ class RedditScraper:
         time_filter: str = "day",
     ) -> list[dict]:
         """Fetch posts from a subreddit."""
+        all_posts = []
+        for batch in self.iter_subreddit_batches(subreddit, limit, category, time_filter):
+            all_posts.extend(batch.to_records())
+        
+        LOGGER.info("Successfully fetched %d posts from r/%s", len(all_posts), subreddit)
+        return all_posts
+
+    def iter_subreddit_batches(
+        self,
+        subreddit: str,
+        limit: int = 10,
+        category: str = "hot",
+        time_filter: str = "day",
+    ) -> Iterator[PostBatch]:
+        """Yield posts from a subreddit one listing page at a time."""
         if category not in ["hot", "top", "new"]:
             raise ValueError("Category must be 'hot', 'top', or 'new'")
+        if limit <= 0:
+            return
 
         LOGGER.info("Fetching posts from r/%s (category: %s, limit: %d, time: %s)",
                     subreddit, category, limit, time_filter)
 
         batch_size = min(100, limit)
         total_fetched = 0
-        after = None
-        all_posts = []
         base_url = f"https://www.reddit.com/r/{subreddit}/{category}.json"
 
-        while total_fetched < limit:
+        def fetch_page(after: str | None) -> requests.Response:
             params = {
                 "limit": batch_size,
                 "after": after,
                 "raw_json": 1,
                 "t": time_filter,
             }
-            
+            return self._make_request(base_url, params=params, stream=True)
+
+        # The next page is requested in the background while the current one
+        # is still being parsed, as soon as its "after" cursor has been read.
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_page = prefetcher.submit(fetch_page, None)
             try:
-                data = self._make_request(base_url, params=params)
-                LOGGER.info("Successfully fetched batch from r/%s", subreddit)
-            except Exception as e:
-                LOGGER.error("Failed to fetch posts from r/%s: %s", subreddit, e, exc_info=True)
-                print(f"❌ Error fetching posts from r/{subreddit}:")
-                print(f"   Type: {type(e).__name__}")
-                print(f"   Message: {e}")
-                break
 
-            posts = data.get("data", {}).get("children", [])
-            
-            if not posts:
-                break
-
-            for post in posts:
-                post_data = post["data"]
-                post_info = {
-                    "title": post_data.get("title", ""),
-                    "author": post_data.get("author", ""),
-                    "subreddit": subreddit,
-                    "permalink": post_data.get("permalink", ""),
-                    "score": post_data.get("score", 0),
-                    "num_comments": post_data.get("num_comments", 0),
-                    "created_utc": post_data.get("created_utc", 0),
-                    "selftext": post_data.get("selftext", ""),
-                }
-                
-                if post_data.get("post_hint") == "image" and "url" in post_data:
-                    post_info["image_url"] = post_data["url"]
-                elif "preview" in post_data and "images" in post_data["preview"]:
-                    post_info["image_url"] = post_data["preview"]["images"][0]["source"]["url"]
-                
-                if "thumbnail" in post_data and post_data["thumbnail"] not in ("self", "default"):
-                    post_info["thumbnail_url"] = post_data["thumbnail"]
+                while next_page is not None:
+                    try:
+                        response = next_page.result()
+                        LOGGER.info("Successfully fetched batch from r/%s", subreddit)
+                    except Exception as e:
+                        # Tracebacks only at DEBUG; the message already names the cause
+                        LOGGER.error(
+                            "Failed to fetch posts from r/%s: %s", subreddit, e,
+                            exc_info=LOGGER.isEnabledFor(logging.DEBUG),
+                        )
+                        break
 
-                all_posts.append(post_info)
-                total_fetched += 1
-                
-                if total_fetched >= limit:
-                    break
+                    next_page = None
+                    needs_next_page = total_fetched + batch_size < limit
+                    listing = {"after": None}
+                    batch = PostBatch(subreddit)
+                    read_failed = False
 
-            after = data.get("data", {}).get("after")
-            if not after:
-                break
+                    # A cached response has no live stream to read from,
+                    # so parse its stored body
+                    if getattr(response, "from_cache", False):
+                        stream = io.BytesIO(response.content)
+                    else:
+                        stream = response.raw
 
-            time.sleep(random.uniform(1, 2))
+                    try:
+                        with response:
+                            for post_data in _iter_listing_posts(stream, listing):
+                                if needs_next_page and next_page is None and listing["after"]:
+                                    next_page = prefetcher.submit(fetch_page, listing["after"])
 
-        LOGGER.info("Successfully fetched %d posts from r/%s", len(all_posts), subreddit)
-        return all_posts
+                                batch.append(post_data)
+                                total_fetched += 1
+                            
+                                if total_fetched >= limit:
+                                    break
+                    except Exception as e:
+                        LOGGER.error(
+                            "Failed to read posts from r/%s: %s", subreddit, e,
+                            exc_info=LOGGER.isEnabledFor(logging.DEBUG),
+                        )
+                        read_failed = True
+                
+                    if batch:
+                        yield batch
+                
+                    if read_failed or not batch or total_fetched >= limit:
+                        break
 
-    def scrape_post_details(self, permalink: str) -> dict[str, Any] | None:
-        """Scrape detailed information from a specific post."""
+                    # "after" came too late in the page to be prefetched
+                    if next_page is None and listing["after"]:
+                        next_page = prefetcher.submit(fetch_page, listing["after"])
+            finally:
+                # Also runs when the consumer stops early, so a prefetched
+                # page never keeps its pooled connection checked out
+                if next_page is not None and not next_page.cancel():
+                    try:
+                        next_page.result().close()
+                    except Exception:
+                        pass
+
+    def scrape_post_details(
+        self,
+        permalink: str,
+        max_comments: int | None = None,
+        depth: int | None = None,
+        sort: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Scrape detailed information from a specific post.
+        
+        ``max_comments``, ``depth`` and ``sort`` are forwarded to Reddit so only
+        the needed part of the comment tree is downloaded. Successful results
+        are cached per scraper instance, and concurrent calls for the same
+        post wait for the one request already in flight.
+        """
+        cache_key = (permalink, max_comments, depth, sort)
+        with self._detail_lock:
+            cached = self._detail_cache.get(cache_key)
+            if cached is not None:
+                self._detail_cache.move_to_end(cache_key)
+                return cached
+            
+            in_flight = self._detail_in_flight.get(cache_key)
+            if in_flight is None:
+                future = self._detail_in_flight[cache_key] = Future()
+        
+        if in_flight is not None:
+            return in_flight.result()
+        
+        details = None
+        try:
+            details = self._fetch_post_details(permalink, max_comments, depth, sort)
+        finally:
+            with self._detail_lock:
+                del self._detail_in_flight[cache_key]
+                if details is not None:
+                    self._detail_cache[cache_key] = details
+                    if len(self._detail_cache) > _DETAIL_CACHE_SIZE:
+                        self._detail_cache.popitem(last=False)
+            future.set_result(details)
+        
+        return details
+
+    def _fetch_post_details(
+        self,
+        permalink: str,
+        max_comments: int | None,
+        depth: int | None,
+        sort: str | None,
+    ) -> dict[str, Any] | None:
+        """Download and parse a post and its comments."""
         url = f"https://www.reddit.com{permalink}.json"
+        params = {
+            "limit": max_comments,
+            "depth": depth,
+            "sort": sort,
+            "raw_json": 1,
+        }
         
         try:
-            post_data = self._make_request(url)
+            post_data = self._make_request(url, params=params)
             LOGGER.info("Successfully fetched post details: %s", permalink)
+        except CircuitOpenError:
+            LOGGER.warning("Skipped post details %s: circuit open", permalink)
+            return None
         except Exception as e:
-            LOGGER.error("Failed to fetch post details %s: %s", permalink, e, exc_info=True)
-            print(f"❌ Error fetching post details: {type(e).__name__}: {e}")
+            LOGGER.error(
+                "Failed to fetch post details %s: %s", permalink, e,
+                exc_info=LOGGER.isEnabledFor(logging.DEBUG),
+            )
             return None
         
         if not isinstance(post_data, list) or len(post_data) < 2:
@@ -173,99 +629,227 @@ class RedditScraper:
         }
 
     def _extract_comments(self, comments: list) -> list[dict]:
-        """Extract comments and replies recursively."""
+        """Extract comments and replies iteratively, preserving the tree shape."""
         extracted_comments = []
+        pending = deque([(extracted_comments, comments)])
+        # Bound once; this loop runs for every comment in the thread
+        popleft = pending.popleft
+        push = pending.append
         
-        for comment in comments:
-            if isinstance(comment, dict) and comment.get("kind") == "t1":
-                comment_data = comment.get("data", {})
-                
-                extracted_comment = {
-                    "author": comment_data.get("author", ""),
-                    "body": comment_data.get("body", ""),
-                    "score": comment_data.get("score", 0),
-                    "replies": [],
-                }
-
-                replies = comment_data.get("replies", "")
-                if isinstance(replies, dict):
-                    extracted_comment["replies"] = self._extract_comments(
-                        replies.get("data", {}).get("children", [])
-                    )
+        while pending:
+            target, children = popleft()
+            add = target.append
+            for comment in children:
+                if type(comment) is not dict or comment.get("kind") != "t1":
+                    continue
                 
-                extracted_comments.append(extracted_comment)
+                get = comment.get("data", {}).get
+                replies = get("replies", "")
+                nested: list[dict] = []
+                add({
+                    "author": get("author", ""),
+                    "body": get("body", ""),
+                    "score": get("score", 0),
+                    "replies": nested,
+                })
+                if type(replies) is dict:
+                    push((nested, replies.get("data", {}).get("children", [])))
         
         return extracted_comments
 
 
+def _parse_retry_after(response: requests.Response | None) -> float | None:
+    """Parse a Retry-After header given as seconds or as an HTTP date."""
+    if response is None:
+        return None
+    
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _iter_listing_posts(stream: IO[bytes], listing: dict) -> Iterator[dict]:
+    """Stream-parse a Reddit listing, yielding each post's ``data`` object.
+    
+    Only one post is materialized at a time. The listing's ``after`` cursor
+    is stored in ``listing`` as soon as it is read. Without ijson the whole
+    body is parsed at once instead.
+    """
+    if ijson is None:
+        data = _json_loads(stream.read()).get("data", {})
+        listing["after"] = data.get("after")
+        for child in data.get("children", []):
+            yield child["data"]
+        return
+    
+    parser = ijson.parse(stream, use_float=True)
+    for prefix, event, value in parser:
+        if prefix == "data.after":
+            listing["after"] = value
+        elif prefix == _LISTING_POST_PREFIX and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            for prefix, event, value in parser:
+                builder.event(event, value)
+                if prefix == _LISTING_POST_PREFIX and event == "end_map":
+                    break
+            yield builder.value
+
+
 def clean_text(text: str) -> str:
     """Clean and normalize text content."""
     if not text:
         return ""
     
     cleaned = text.strip()
-    if "[deleted]" in cleaned.lower() or "[removed]" in cleaned.lower():
+    if _DELETED_RE.search(cleaned):
         return ""
     
     return cleaned
 
 
 def extract_all_comments_text(comments: list[dict]) -> list[str]:
-    """Recursively extract all comment text from a comments tree."""
+    """Extract all comment text from a comments tree in depth-first order."""
     all_text = []
+    pending = deque(comments)
     
-    for comment in comments:
+    while pending:
+        comment = pending.popleft()
         body = clean_text(comment.get("body", ""))
         if body:
             all_text.append(body)
         
-        if comment.get("replies"):
-            all_text.extend(extract_all_comments_text(comment["replies"]))
+        replies = comment.get("replies")
+        if replies:
+            # Visit replies before the next sibling, as the recursive walk did
+            pending.extendleft(reversed(replies))
     
     return all_text
 
 
+def _attach_top_comments(
+    scraper: RedditScraper, batch: PostBatch, index: int, max_comments_per_post: int
+) -> None:
+    """Fetch a post's comments and store the cleaned top comments in its batch."""
+    try:
+        post_details = scraper.scrape_post_details(
+            batch.permalinks[index],
+            max_comments=max_comments_per_post,
+            depth=1,
+            sort="top"
+        )
+        if post_details and post_details.get('comments'):
+            comments_text = extract_all_comments_text(
+                post_details['comments'][:max_comments_per_post]
+            )
+            batch.top_comments[index] = comments_text[:max_comments_per_post]
+        else:
+            batch.top_comments[index] = []
+    except Exception as e:
+        LOGGER.warning("Failed to fetch comments: %s", e)
+        batch.top_comments[index] = []
+
+
 def fetch_posts_from_subreddits(
-    subreddits: list[str],
-    brightdata_api_key: str,
+    subreddits: Sequence[str],
+    brightdata_api_key: str | None = None,
     category: str = "hot",
     time_filter: str = "day",
     posts_per_subreddit: int = 10,
     include_comments: bool = True,
-    max_comments_per_post: int = 10
+    max_comments_per_post: int = 10,
+    max_listing_workers: int = _LISTING_WORKERS,
+    max_comment_workers: int = _COMMENT_WORKERS,
+    scraper: RedditScraper | None = None
 ) -> list[dict]:
-    """Fetch posts from multiple subreddits using Bright Data."""
-    scraper = RedditScraper(brightdata_api_key=brightdata_api_key)
-    all_posts = []
+    """Fetch posts from multiple subreddits concurrently using Bright Data.
     
-    for subreddit in subreddits:
-        try:
-            posts = scraper.fetch_subreddit_posts(
+    Pass an existing ``scraper`` to reuse it (and its caches) across calls;
+    otherwise one is created from ``brightdata_api_key`` with a connection
+    pool sized for the requested workers.
+    """
+    # Drop repeated subreddits so their listings aren't downloaded twice
+    subreddits = list(dict.fromkeys(subreddits))
+    if not subreddits:
+        return []
+
+    listing_workers = min(max_listing_workers, len(subreddits))
+    # Every listing worker can also have its next page prefetching
+    pool_needed = 2 * listing_workers + max_comment_workers
+    if scraper is None:
+        scraper = RedditScraper(brightdata_api_key=brightdata_api_key, pool_maxsize=pool_needed)
+    elif pool_needed > scraper.pool_maxsize:
+        LOGGER.warning(
+            "%d concurrent requests exceed the scraper's pool of %d connections; "
+            "extra connections will be discarded after use",
+            pool_needed, scraper.pool_maxsize,
+        )
+    batches_by_subreddit: list[list[PostBatch]] = [[] for _ in subreddits]
+    
+    # Listing requests are network-bound, so fetch subreddits in parallel and
+    # start comment lookups for each listing page as soon as it is parsed,
+    # while the next page is still in flight. The comment pool bounds how
+    # many detail requests run at the same time.
+    with ThreadPoolExecutor(max_workers=listing_workers) as listing_pool, \
+            ThreadPoolExecutor(max_workers=max_comment_workers) as comment_pool:
+        
+        def fetch_subreddit(subreddit: str) -> list[PostBatch]:
+            batches = []
+            for batch in scraper.iter_subreddit_batches(
                 subreddit=subreddit,
                 limit=posts_per_subreddit,
                 category=category,
                 time_filter=time_filter
-            )
-            
-            if include_comments:
-                for post in posts:
-                    try:
-                        post_details = scraper.scrape_post_details(post['permalink'])
-                        if post_details and post_details.get('comments'):
-                            comments_text = extract_all_comments_text(
-                                post_details['comments'][:max_comments_per_post]
-                            )
-                            post['top_comments'] = comments_text[:max_comments_per_post]
-                        else:
-                            post['top_comments'] = []
-                    except Exception as e:
-                        LOGGER.warning("Failed to fetch comments: %s", e)
-                        post['top_comments'] = []
-            
-            all_posts.extend(posts)
-            print(f"✅ Fetched {len(posts)} posts from r/{subreddit}")
-        except Exception as e:
-            print(f"❌ Error fetching from r/{subreddit}: {type(e).__name__}: {e}")
-            LOGGER.error("Failed to fetch from r/%s: %s", subreddit, e, exc_info=True)
+            ):
+                batches.append(batch)
+                if not include_comments:
+                    continue
+                # Don't queue detail requests that would only be short-circuited,
+                # but keep the records' shape the same as a failed lookup
+                if scraper.circuit_open:
+                    for index in range(len(batch)):
+                        batch.top_comments[index] = []
+                    continue
+                for index in range(len(batch)):
+                    comment_pool.submit(
+                        _attach_top_comments, scraper, batch, index, max_comments_per_post
+                    )
+            return batches
+        
+        futures = {
+            listing_pool.submit(fetch_subreddit, subreddit): index
+            for index, subreddit in enumerate(subreddits)
+        }
         
-    return all_posts
+        for future in as_completed(futures):
+            index = futures[future]
+            subreddit = subreddits[index]
+            try:
+                batches = future.result()
+                LOGGER.info("Fetched %d posts from r/%s", sum(map(len, batches)), subreddit)
+            except Exception as e:
+                LOGGER.error(
+                    "Failed to fetch from r/%s: %s", subreddit, e,
+                    exc_info=LOGGER.isEnabledFor(logging.DEBUG),
+                )
+                continue
+            
+            batches_by_subreddit[index] = batches
+    
+    # Keep the configured subreddit order regardless of completion order
+    return [
+        post
+        for batches in batches_by_subreddit
+        for batch in batches
+        for post in batch.to_records()
+    ]
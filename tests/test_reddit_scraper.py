@@ -0,0 +1,331 @@
+"""Tests for the Bright Data backed Reddit scraper."""
+import gzip
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import reddit_scraper
+from reddit_scraper import RedditScraper
+
+LISTING = {
+    "kind": "Listing",
+    "data": {
+        "after": None,
+        "children": [
+            {"kind": "t3", "data": {"title": f"Post {i}", "author": "alice", "score": i}}
+            for i in range(3)
+        ],
+    },
+}
+
+
+@pytest.fixture
+def brightdata(monkeypatch):
+    """Serve a gzip-encoded listing in place of the Bright Data endpoint."""
+    pytest.importorskip("requests_cache")
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            requests_seen.append(json.loads(self.rfile.read(length)))
+            body = gzip.compress(json.dumps(LISTING).encode())
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        reddit_scraper, "_BRIGHTDATA_URL", f"http://127.0.0.1:{server.server_port}/request"
+    )
+    yield requests_seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_cached_listing_is_parsed_on_rerun(brightdata, tmp_path):
+    scraper = RedditScraper("key", cache_name=str(tmp_path / "cache"))
+
+    first = scraper.fetch_subreddit_posts("python", limit=3)
+    second = scraper.fetch_subreddit_posts("python", limit=3)
+
+    assert [p["title"] for p in first] == ["Post 0", "Post 1", "Post 2"]
+    assert second == first
+    assert len(brightdata) == 1
+
+
+def test_cache_hits_skip_rate_limiting(brightdata, tmp_path, monkeypatch):
+    scraper = RedditScraper("key", cache_name=str(tmp_path / "cache"))
+    scraper.fetch_subreddit_posts("python", limit=3)
+
+    acquired = []
+    monkeypatch.setattr(scraper._limiter, "acquire", lambda: acquired.append(True))
+    monkeypatch.setattr(
+        RedditScraper, "_respect_rate_limit", staticmethod(lambda headers: acquired.append(headers))
+    )
+    scraper.fetch_subreddit_posts("python", limit=3)
+
+    assert acquired == []
+    assert len(brightdata) == 1
+
+
+@pytest.mark.parametrize("retry_after", ["86400", "Fri, 31 Dec 2100 23:59:59 GMT"])
+def test_retry_after_is_capped(retry_after):
+    response = requests.Response()
+    response.headers["Retry-After"] = retry_after
+
+    assert RedditScraper._retry_delay(0.5, response) == reddit_scraper._BACKOFF_CAP
+
+
+class FakeResponse:
+    """Streamed listing response as returned by ``_make_request(stream=True)``."""
+
+    def __init__(self, listing):
+        self.raw = io.BytesIO(json.dumps(listing).encode())
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.closed = True
+
+
+def listing_page(after, count=3):
+    return {
+        "kind": "Listing",
+        "data": {
+            "after": after,
+            "children": [{"kind": "t3", "data": {"title": f"Post {i}"}} for i in range(count)],
+        },
+    }
+
+
+@pytest.fixture
+def paged_scraper(monkeypatch):
+    """Scraper whose listing requests return endless pages of three posts."""
+    scraper = RedditScraper("key")
+    responses = []
+
+    def fake_request(url, params=None, max_retries=3, stream=False):
+        response = FakeResponse(listing_page(after=f"page{len(responses) + 1}"))
+        responses.append(response)
+        return response
+
+    monkeypatch.setattr(scraper, "_make_request", fake_request)
+    return scraper, responses
+
+
+def test_zero_limit_sends_no_request(paged_scraper):
+    scraper, responses = paged_scraper
+
+    assert scraper.fetch_subreddit_posts("python", limit=0) == []
+    assert responses == []
+
+
+def test_early_close_releases_prefetched_page(paged_scraper):
+    scraper, responses = paged_scraper
+
+    batches = scraper.iter_subreddit_batches("python", limit=300)
+    assert len(next(batches)) == 3
+    # Let the prefetch start so it can't simply be cancelled
+    deadline = time.monotonic() + 5
+    while len(responses) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    batches.close()
+
+    assert len(responses) == 2
+    assert all(response.closed for response in responses)
+
+
+def test_open_circuit_still_sets_top_comments(paged_scraper, monkeypatch):
+    scraper, _ = paged_scraper
+    monkeypatch.setattr(scraper, "_circuit_open_until", time.monotonic() + 60)
+    monkeypatch.setattr(
+        scraper, "scrape_post_details", lambda *args, **kwargs: pytest.fail("details fetched")
+    )
+
+    posts = reddit_scraper.fetch_posts_from_subreddits(
+        ["python"], posts_per_subreddit=3, scraper=scraper
+    )
+
+    assert [post["top_comments"] for post in posts] == [[], [], []]
+
+
+class FakeClock:
+    """Stands in for the ``time`` module so waits are recorded, not slept."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(reddit_scraper, "time", fake)
+    return fake
+
+
+def make_response(status, body=b"{}"):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.raw = io.BytesIO(body)
+    response.url = reddit_scraper._BRIGHTDATA_URL
+    return response
+
+
+def test_token_bucket_reserves_and_waits(clock):
+    bucket = reddit_scraper.TokenBucket(rate=2.0, capacity=2)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    # Each caller past the burst reserves a token and waits for its refill
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == [0.5, 1.0]
+
+    # 1.5s refills the two borrowed tokens and one more
+    clock.now += 1.5
+    bucket.acquire()
+    assert clock.sleeps == [0.5, 1.0]
+
+
+def test_circuit_opens_after_consecutive_failures(clock, monkeypatch):
+    scraper = RedditScraper("key")
+    sent = []
+    monkeypatch.setattr(
+        scraper.session, "post", lambda *args, **kwargs: sent.append(1) or make_response(503)
+    )
+
+    with pytest.raises(requests.HTTPError):
+        scraper._make_request(
+            "https://www.reddit.com/r/python.json",
+            max_retries=reddit_scraper._CIRCUIT_THRESHOLD - 1,
+        )
+    assert not scraper.circuit_open
+
+    with pytest.raises(requests.HTTPError):
+        scraper._make_request("https://www.reddit.com/r/python.json", max_retries=1)
+    assert scraper.circuit_open
+    assert len(sent) == reddit_scraper._CIRCUIT_THRESHOLD
+
+
+def test_open_circuit_raises_before_sending(clock, monkeypatch):
+    scraper = RedditScraper("key")
+    scraper._circuit_open_until = clock.now + 60
+    monkeypatch.setattr(
+        scraper.session, "post", lambda *args, **kwargs: pytest.fail("request sent")
+    )
+
+    with pytest.raises(reddit_scraper.CircuitOpenError):
+        scraper._make_request("https://www.reddit.com/r/python.json")
+
+
+def test_circuit_resets_after_cooldown(clock, monkeypatch):
+    scraper = RedditScraper("key")
+    responses = [make_response(503)] * reddit_scraper._CIRCUIT_THRESHOLD
+    responses.append(make_response(200, b'{"ok": true}'))
+    monkeypatch.setattr(scraper.session, "post", lambda *args, **kwargs: responses.pop(0))
+
+    with pytest.raises(requests.HTTPError):
+        scraper._make_request(
+            "https://www.reddit.com/r/python.json", max_retries=reddit_scraper._CIRCUIT_THRESHOLD
+        )
+    assert scraper.circuit_open
+
+    clock.now += reddit_scraper._CIRCUIT_MAX_COOLDOWN
+    assert not scraper.circuit_open
+    assert scraper._make_request("https://www.reddit.com/r/python.json") == {"ok": True}
+    assert scraper._circuit_failures == 0
+
+
+@pytest.fixture
+def details_scraper(monkeypatch):
+    """Scraper whose post-detail downloads are recorded instead of sent."""
+    scraper = RedditScraper("key")
+    fetched = []
+
+    def fake_fetch(permalink, max_comments, depth, sort):
+        fetched.append(permalink)
+        time.sleep(0.05)
+        return {"title": permalink, "body": "", "comments": []}
+
+    monkeypatch.setattr(scraper, "_fetch_post_details", fake_fetch)
+    return scraper, fetched
+
+
+def test_concurrent_detail_lookups_share_one_request(details_scraper):
+    scraper, fetched = details_scraper
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: scraper.scrape_post_details("/r/a/1"), range(8)))
+
+    assert fetched == ["/r/a/1"]
+    assert all(result is results[0] for result in results)
+
+
+def test_failed_detail_lookup_is_not_cached(details_scraper, monkeypatch):
+    scraper, fetched = details_scraper
+    monkeypatch.setattr(
+        scraper, "_fetch_post_details", lambda *args: fetched.append(args[0])
+    )
+
+    assert scraper.scrape_post_details("/r/a/1") is None
+    assert scraper.scrape_post_details("/r/a/1") is None
+
+    assert fetched == ["/r/a/1", "/r/a/1"]
+    assert scraper._detail_in_flight == {}
+    assert len(scraper._detail_cache) == 0
+
+
+def test_detail_cache_evicts_least_recently_used(details_scraper, monkeypatch):
+    scraper, fetched = details_scraper
+    monkeypatch.setattr(reddit_scraper, "_DETAIL_CACHE_SIZE", 2)
+
+    scraper.scrape_post_details("/r/a/1")
+    scraper.scrape_post_details("/r/a/2")
+    scraper.scrape_post_details("/r/a/1")  # cache hit, now most recently used
+    scraper.scrape_post_details("/r/a/3")
+
+    assert [key[0] for key in scraper._detail_cache] == ["/r/a/1", "/r/a/3"]
+    scraper.scrape_post_details("/r/a/2")
+    assert fetched == ["/r/a/1", "/r/a/2", "/r/a/3", "/r/a/2"]
+
+
+def test_failed_streamed_responses_are_closed(clock, monkeypatch):
+    scraper = RedditScraper("key")
+    responses = [make_response(503), make_response(404)]
+    sent = list(responses)
+    monkeypatch.setattr(scraper.session, "post", lambda *args, **kwargs: responses.pop(0))
+
+    with pytest.raises(requests.HTTPError):
+        scraper._make_request("https://www.reddit.com/r/python.json", stream=True)
+
+    assert [response.raw.closed for response in sent] == [True, True]